@@ -36,10 +36,24 @@ if __name__ == '__main__':
     # # in the following folder: 'Performance/performance_data/raw_output_data'
     # gameManager.perf_manager.reshape_raw_output_data(True)
     #
+    # # (optional) compare the time used to generate the data set of each raw_output_data file, row by row
+    # # and vectorized (nothing is saved)
+    # gameManager.perf_manager.benchmark_data_sets()
+    #
+    # # (optional) convert text data sets ('.out' files) of previous versions into binary '.npy' files
+    # gameManager.perf_manager.convert_data_set_files()
+    #
     # # load data_set for following path: Performance/performance_data/data_set/Input_Data
     # gameManager.perf_manager.load_input_data_set()
     # gameManager.neural_network.split_data_set(4/5)
     #
+    # # (optional) instead of split_data_set: stream the data set of each raw_output_data file from disk
+    # # (for data sets that don't fit in memory)
+    # gameManager.neural_network.set_streaming_data_set(4/5)
+    #
+    # # (optional) compare the throughput of the in-memory and streaming data sets (after load_input_data_set)
+    # gameManager.neural_network.benchmark_data_pipelines(4/5)
+    #
     # # Neural network
     # gameManager.neural_network.set_tensorboard_cnn()
     # gameManager.neural_network.train_model()
@@ -71,6 +85,11 @@ if __name__ == '__main__':
     # # If the parameter optimize is True, the patterns will be optimized \
     # # (number=number of patterns; iteration=number of iterations for the optimization process)
     # gameManager.perf_manager.sort_optimize_patterns(number=50, optimize= True, iterations=250)
+    # # batched optimization: random patterns are predicted by batches and the best ones are mutated
+    # # (iterations= number of patterns evaluated; time_budget= maximum seconds for each pattern, 0.0= no budget;
+    # # see NeuralNetwork.opt_... attributes for the batch size and the mutations)
+    # gameManager.perf_manager.sort_optimize_patterns(number=50, optimize= True, iterations=20000, batched=True,
+    #                                                 time_budget=10.0)
     # ------------------------------------------------------------------------------------------------------------------
     #
     # #SECTION 4 - Evaluation of training sessions - Only for evaluation modes (1 and 2):
@@ -0,0 +1,124 @@
+"""
+Project: Adaptive Rhythmic Training Application (ARTA)
+File   : evaluationengine.py
+Author : Yann Savard
+
+This code is open source, except for some parts that were taken
+from external sources and their sources are mentioned in the code.
+"""
+
+import os
+
+#multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+#numpy
+import numpy as np
+
+
+# rows of the sections of an evaluation round (600 runits) that are added for the averages: [first row, last row + 1]
+# tests: only the last 12 of the 24 runits ; part 1: 96 runits, but only the rows 48 to 119 were added
+# (the 24 runits of test 1 were added to part 1 with the value 0 and the sum was done on the first 96 values)
+EVALUATION_SECTIONS = np.array([
+    [36, 48],    # test 1
+    [48, 120],   # part 1
+    [156, 168],  # test 2
+    [168, 288],  # part 2
+    [300, 312],  # test 3
+    [312, 432],  # part 3
+    [444, 456],  # test 4
+    [456, 576],  # part 4
+    [588, 600],  # test 5
+])
+
+
+def get_section_sums(data, sections=EVALUATION_SECTIONS):
+    """
+    Returns the sums of each section for all the parameters (columns) of a raw output data file. The values are
+    added in order (like a loop over the rows), so the sums are exactly the same.
+    :param data: np.array of shape (rows, parameters)
+    :param sections: np.array of shape (sections, 2) - first row and last row + 1 of each section
+    :return: np.array of shape (sections, parameters)
+    """
+    sums = np.zeros((len(sections), data.shape[1]))
+    for i, (begin, end) in enumerate(sections):
+        # cumulative sums are calculated in order, np.sum is not
+        sums[i] = np.cumsum(data[begin:end], axis=0)[-1]
+    return sums
+
+
+def load_session_file(path):
+    """
+    Loads a raw output data file and returns the sums of its sections (used by the processes of
+    EvaluationEngine.load_files(), so it must be a function of the module).
+    :param path: path of the file
+    :return: np.array of shape (sections, parameters)
+    """
+    return get_section_sums(np.loadtxt(path, delimiter=",", ndmin=2))
+
+
+class EvaluationEngine():
+    def __init__(self, workers=None, min_parallel_files=8):
+        """
+        Cache of the raw output data files of the evaluation trainings (PerformanceManager.show_methods_evaluation).
+        Each file is loaded once and only the sums of its sections are saved (for all parameters); it is loaded again
+        only when its modification time changed. The files that are not in the cache are loaded by a pool of processes.
+
+        :param workers: number of processes loading the files (None: number of processors)
+        :param min_parallel_files: minimum number of files to load for starting the processes (starting them takes
+                                   longer than loading a few files)
+        """
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.min_parallel_files = min_parallel_files
+        self.sessions = {} # keys: file path ; values: (modification time, section sums)
+
+    def get_folder_files(self, path):
+        """
+        Returns the paths and modification times of all files in a folder (in the same order as os.listdir).
+        :param path: folder path
+        :return: list of (file path, modification time)
+        """
+        files = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files.append((os.path.join(path, entry.name), entry.stat().st_mtime_ns))
+        return files
+
+    def load_files(self, files):
+        """
+        Loads the files that are not in the cache or were modified since they were loaded.
+        :param files: list of (file path, modification time)
+        :return: nothing
+        """
+        stale = [(path, mtime) for path, mtime in files
+                 if path not in self.sessions or self.sessions[path][0] != mtime]
+        if len(stale) == 0:
+            return
+
+        paths = [path for path, mtime in stale]
+        if self.workers > 1 and len(stale) >= self.min_parallel_files:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(stale))) as pool:
+                results = list(pool.map(load_session_file, paths,
+                                        chunksize=max(1, len(paths) // (self.workers * 4))))
+        else:
+            results = [load_session_file(path) for path in paths]
+
+        for (path, mtime), sums in zip(stale, results):
+            self.sessions[path] = (mtime, sums)
+
+    def get_section_sums(self, path):
+        """
+        Returns the section sums of all files in a folder, loading the files that are not in the cache.
+        :param path: folder path
+        :return: np.array of shape (files, sections, parameters)
+        """
+        files = self.get_folder_files(path)
+        self.load_files(files)
+        if len(files) == 0:
+            return np.zeros((0, len(EVALUATION_SECTIONS), 0))
+        return np.stack([self.sessions[file_path][1] for file_path, mtime in files])
+
+    def clear(self):
+        """Removes all files from the cache."""
+        self.sessions.clear()
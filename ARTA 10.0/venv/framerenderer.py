@@ -0,0 +1,106 @@
+"""
+Project: Adaptive Rhythmic Training Application (ARTA)
+File   : framerenderer.py
+Author : Yann Savard
+
+This code is open source, except for some parts that were taken
+from external sources and their sources are mentioned in the code.
+"""
+
+import pygame
+
+
+class FrameRenderer():
+    def __init__(self, background=(0, 0, 0)):
+        """
+        Renders the frames of the graphical interface with dirty rectangles: the images of a frame are given with
+        self.draw() and self.end_frame() compares them with the images of the previous frame. Only the areas of the
+        images that were added, removed, moved or changed are cleared, redrawn and updated on the display.
+
+        :param background: color of the background
+        """
+        self.background = background
+        self.items = {} # images of the frame being built - keys: item key ; values: (image, position, rect)
+        self.drawn = {} # images of the last frame rendered - keys: item key ; values: (image, position, rect)
+        self.full_redraw = True # True if the whole screen must be redrawn at the next frame
+
+    def invalidate(self):
+        """Redraws the whole screen at the next frame (when the images or the screen were changed elsewhere)."""
+        self.full_redraw = True
+
+    def begin_frame(self):
+        """Starts a new frame. The images must be given again with self.draw() for each frame."""
+        self.items = {}
+
+    def draw(self, key, img, pos):
+        """
+        Adds an image to the frame. The images are drawn in the order they were added.
+        :param key: unique key of the item (e.g. ('grid', 3), 'needle')
+        :param img: pygame surface
+        :param pos: position of the image on the screen
+        :return: nothing
+        """
+        rect = img.get_rect(topleft=(int(pos[0]), int(pos[1])))
+        self.items[key] = (img, pos, rect)
+
+    def end_frame(self, screen):
+        """
+        Renders the frame on the screen and updates the dirty areas of the display.
+        :param screen: pygame display surface
+        :return: number of updated areas
+        """
+        if self.full_redraw:
+            screen.fill(self.background)
+            for img, pos, rect in self.items.values():
+                screen.blit(img, pos)
+            pygame.display.update()
+            self.full_redraw = False
+            self.drawn = self.items
+            return 1
+
+        dirty_rects = self.merge_rects(self.get_dirty_rects())
+        for dirty_rect in dirty_rects:
+            screen.set_clip(dirty_rect)
+            screen.fill(self.background, dirty_rect)
+            for img, pos, rect in self.items.values():
+                if rect.colliderect(dirty_rect):
+                    screen.blit(img, pos)
+        screen.set_clip(None)
+
+        pygame.display.update(dirty_rects)
+        self.drawn = self.items
+        return len(dirty_rects)
+
+    def get_dirty_rects(self):
+        """Returns the rects of the images that are different from the last frame (old and new areas)."""
+        dirty_rects = []
+        for key, (img, pos, rect) in self.items.items():
+            drawn = self.drawn.get(key)
+            if drawn is None:
+                dirty_rects.append(rect)
+            elif drawn[0] is not img or drawn[1] != pos:
+                dirty_rects.append(drawn[2])
+                dirty_rects.append(rect)
+
+        for key, (img, pos, rect) in self.drawn.items():
+            if key not in self.items:
+                dirty_rects.append(rect)
+
+        return dirty_rects
+
+    def merge_rects(self, rects):
+        """
+        Merges the rects that overlap or touch each other (e.g. the images of the way moving together), so each area
+        is redrawn only once. The rects are enlarged by 1 pixel to include the rounding of float positions.
+        :param rects: list of pygame.Rect
+        :return: list of merged pygame.Rect
+        """
+        merged = []
+        for rect in rects:
+            rect = rect.inflate(2, 2)
+            idx = rect.collidelist(merged)
+            while idx != -1:
+                rect.union_ip(merged.pop(idx))
+                idx = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
@@ -0,0 +1,67 @@
+"""
+Project: Adaptive Rhythmic Training Application (ARTA)
+File   : framestats.py
+Author : Yann Savard
+
+This code is open source, except for some parts that were taken
+from external sources and their sources are mentioned in the code.
+"""
+
+from bisect import bisect_right
+
+
+class FrameStats():
+    def __init__(self, bins_ms=(0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, 100)):
+        """
+        Histograms of the times measured in the pygame process:
+        - 'frame_time': time to build and render a frame
+        - 'frame_interval': time between two rendered frames
+        - 'input_latency': maximum time a key waited before it was handled (time since the previous poll of the
+          events)
+        - 'tick_jitter': delay between the scheduled time of a timer tick and its dispatch (see NoteScheduler)
+        - 'sound_jitter': delay between the scheduled time of a metronome sound and the midi message
+
+        :param bins_ms: upper limits of the histogram bins in milliseconds (the last bin counts the longer times)
+        """
+        self.bins_ms = bins_ms
+        self.bins = [limit * 0.001 for limit in bins_ms]
+        self.names = ['frame_time', 'frame_interval', 'input_latency', 'tick_jitter', 'sound_jitter']
+        self.histograms = {}
+        self.maximums = {}
+        self.reset()
+
+    def reset(self):
+        """Sets all counts to 0."""
+        for name in self.names:
+            self.histograms[name] = [0] * (len(self.bins) + 1)
+            self.maximums[name] = 0.0
+
+    def add(self, name, seconds):
+        """
+        Adds a measured time to a histogram.
+        :param name: name of the histogram (see self.names)
+        :param seconds: measured time in seconds
+        :return: nothing
+        """
+        self.histograms[name][bisect_right(self.bins, seconds)] += 1
+        if seconds > self.maximums[name]:
+            self.maximums[name] = seconds
+
+    def get_histograms(self):
+        """
+        Returns the histograms.
+        :return: dict - keys: histogram names ; values: list of (bin label, count)
+        """
+        labels = [f"<{limit}ms" for limit in self.bins_ms] + [f">={self.bins_ms[-1]}ms"]
+        return {name: list(zip(labels, self.histograms[name])) for name in self.names}
+
+    def show_histograms(self):
+        """Prints the histograms and the maximum times."""
+        for name, histogram in self.get_histograms().items():
+            total = sum(count for label, count in histogram)
+            if total == 0:
+                continue
+            print(f"{name}: {total} values, max {self.maximums[name] * 1000:.2f}ms")
+            for label, count in histogram:
+                if count > 0:
+                    print(f"   {label:>9}: {count:7d} ({100.0 * count / total:5.1f}%)")
@@ -0,0 +1,65 @@
+"""
+Project: Adaptive Rhythmic Training Application (ARTA)
+File   : metricschannel.py
+Author : Yann Savard
+
+This code is open source, except for some parts that were taken
+from external sources and their sources are mentioned in the code.
+"""
+
+#multiprocessing
+from multiprocessing.sharedctypes import RawArray, RawValue
+
+#numpy
+import numpy as np
+
+
+class MetricsChannel():
+    def __init__(self, metrics=5, capacity=1024):
+        """
+        Ring buffer in shared memory that publishes the live graphics values of each note from the pygame process
+        to the graph processes. There is only one writer (the pygame process), so no lock is used: a row is written
+        first and the number of published rows is incremented after it.
+
+        The channel must be created before the processes are started (see GameManager.start_multi_processes).
+
+        :param metrics: number of values published for each note
+        :param capacity: number of notes kept in the ring buffer
+        """
+        self.metrics = metrics
+        self.capacity = capacity
+        self.values = RawArray('d', capacity * metrics) # shared ring buffer (capacity rows of metrics values)
+        self.count = RawValue('q', 0) # number of rows published since the start of the program
+
+    def get_buffer(self):
+        """
+        Returns the shared ring buffer as a np.array of shape (self.capacity, self.metrics), without copy.
+        """
+        return np.frombuffer(self.values, dtype=np.float64).reshape(self.capacity, self.metrics)
+
+    def publish(self, values):
+        """
+        Writes the values of a note in the ring buffer.
+        :param values: list of self.metrics values
+        :return: nothing
+        """
+        count = self.count.value
+        self.get_buffer()[count % self.capacity] = values
+        self.count.value = count + 1
+
+    def read(self, metric, number):
+        """
+        Reads the values of a metric for the last notes published.
+        :param metric: index of the value in the published rows
+        :param number: maximum number of notes to read
+        :return: np.array of note numbers (0= first note published); np.array of the values for these notes
+        """
+        count = self.count.value
+        number = min(number, count, self.capacity - 1)
+        notes = np.arange(count - number, count)
+        values = self.get_buffer()[notes % self.capacity, metric]
+
+        # drop the rows that the pygame process overwrote while they were read
+        oldest = self.count.value - self.capacity + 1
+        valid = notes >= oldest
+        return notes[valid], values[valid]
@@ -0,0 +1,716 @@
+
+"""
+Project: Adaptive Rhythmic Training Application (ARTA)
+File   : neuralnetwork.py
+Date   : 21/01/2022
+Author : Yann Savard
+
+This code is open source, except for some parts that were taken
+from external sources and their sources are mentioned in the code.
+
+History: programmed from september 2021 to february 2022 as part of my bachelor project:
+"Conception and Evaluation of New Rhythm-Based Dexterity Training Methods with Adaptive Game Mechanics and AI"
+"""
+
+#source: Classify Images Using Python & Machine Learning - https://www.youtube.com/watch?v=iGWbqhdjf2s
+
+import tensorflow as tf
+from tensorflow import keras
+
+from keras.models import Sequential, save_model, load_model
+from keras.layers import Dense, Flatten, Conv2D, MaxPooling2D, Dropout, LSTM, Bidirectional, Conv1D
+from keras.layers import Lambda, Reshape, Permute, Input, add, Conv3D, GaussianNoise, concatenate
+from keras.layers import ConvLSTM2D, BatchNormalization, TimeDistributed, Add, Activation, GaussianNoise
+
+from tensorflow.keras import layers
+from tensorflow.python.keras.callbacks import TensorBoard
+
+
+from time import time
+from tensorflow.keras.utils import to_categorical
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+from keras.datasets import mnist
+
+import os
+import random as rnd
+
+os.environ['KMP_DUPLICATE_LIB_OK']='True' # to avoid error 15:
+
+class NeuralNetwork():
+	def __init__(self, g_manager):
+		self.gm= g_manager
+		self.pm = None
+		self.tensorboard=None
+		self.model=None
+
+		#data set
+		self.split_ratio = 0.0
+		self.x_train=[]
+		self.x_test=[]
+		self.y_train=[]
+		self.y_test=[]
+
+		# streaming data set (see self.set_streaming_data_set) - used instead of the arrays above if it is set
+		self.data_set_folder = 'Performance/performance_data/data_set'
+		self.shards_x = [] # memory mapped x data set of each raw_output_data file
+		self.shards_y = [] # memory mapped y data set of each raw_output_data file
+		self.shards_offsets = np.zeros(1, dtype=np.int64) # index of the first input of each shard (+ total inputs)
+		self.stream_train = None # tf.data.Dataset of the training inputs
+		self.stream_validation = None # tf.data.Dataset of the validation inputs (end of the training inputs)
+		self.stream_test = None # tf.data.Dataset of the test inputs
+		self.stream_train_size = 0 # number of training inputs, validation inputs included (like self.x_train.shape[0])
+		self.stream_shuffle_buffer = 8192 # number of input indexes shuffled together
+		self.stream_adjust_values = False # True= parameter 27 multiplied by 0.3 (see self.adjust_data_values)
+
+		# optimization of rhythmic patterns
+		self.truth = []
+
+		self.best_acc_x = []
+		self.best_acc_y = []
+
+		self.best_perf_x = []
+		self.best_perf_y = []
+
+		self.best_bpm_x = []
+		self.best_bpm_y = []
+
+		#tensorboard
+		self.writer=None
+		self.training_log_dir = None
+
+		#training history
+		self.hist=[]
+
+
+		#hyper-parameters of the neural network
+		self.hidden_layers=0
+		self.batch_size=0
+		self.learning_rate=0.0
+		self.decay= 0.0
+		self.epochs=0
+		self.validation_split=0.0
+
+		#batched optimization of rhythmic patterns (method self.optimize_patterns_batched)
+		self.opt_batch_size = 256 # number of candidate patterns predicted at once
+		self.opt_survivors = 16 # best candidates kept for the next generation (0= random search only)
+		self.opt_mutation_rate = 0.125 # probability that a rhythmic value of a survivor is changed
+		self.opt_random_ratio = 0.25 # ratio of new random candidates in each generation
+
+
+	def set_tensorboard_cnn(self):
+		"""Sets tensorboard and compiles the neural network. NOTE: tensorboard is not functional in this version.
+		The history of training of the model is shown in the method self.evaluate_model instead of tensorboard."""
+		self.set_tensorboard()
+		self.set_compile_neural_network()
+
+
+	def set_tensorboard(self):
+		"""Sets tensorboard adn the training_log_dir.""" # source:
+		self.tensorboard= TensorBoard(log_dir="Logs/{}".format(time()))
+		self.training_log_dir = os.path.join(self.tensorboard.log_dir, 'training')
+		self.writer= tf.summary.create_file_writer(self.training_log_dir)
+
+
+	def split_data_set(self, factor):
+		"""Splits the self.pm.all_data_x and self.pm.all_data_y data sets into training and validation sets for
+		the neural network, according to ratio given in parameter (factor)"""
+
+		self.pm= self.gm.perf_manager
+		self.split_ratio=factor
+
+		x_set = self.pm.all_data_x
+		y_set = self.pm.all_data_y
+		print("Total data: ", len(self.pm.all_data_y))
+
+		#reshape x_set and add 3 arrays with 0.0 values on axis 1 to make the size (x_set.shape[0], 28,28)
+
+		x_set = np.reshape(x_set, (x_set.shape[0], x_set.shape[1],x_set.shape[2]))
+		x_new_shape=(x_set.shape[0], 28, x_set.shape[2])
+		new_x_set=np.zeros(x_new_shape)
+		new_x_set[:, 3:] = x_set[:, :25]
+		x_set=new_x_set
+
+
+		axis0_size_x = np.size(x_set, 0)
+		axis0_size_y = np.size(y_set, 0)
+
+		shape_x_train= (round(axis0_size_x * factor), 28, 28)
+		shape_x_test=  (round(axis0_size_x - shape_x_train[0]), 28, 28)
+
+		shape_y_train= (round(axis0_size_y * factor),28)
+		shape_y_test=  (round(axis0_size_y - shape_y_train[0]),28)
+
+
+		self.x_train= np.zeros(shape_x_train)
+		print("Total x_train: ", self.x_train.shape[0])
+		self.x_test= np.zeros(shape_x_test)
+		print("Total x_test: ", self.x_test.shape[0])
+		self.y_train = np.zeros(shape_y_train)
+		print("Total y_train: ", len(self.y_train))
+		self.y_test = np.zeros(shape_y_test)
+		print("Total y_test: ", len(self.y_test))
+
+		# x values (the last input is not copied: its array stays at 0.0)
+		factor1 = shape_x_train[0]
+		last = axis0_size_x - 1
+		self.x_train[:min(factor1, last)] = x_set[:min(factor1, last)]
+		if last > factor1:
+			self.x_test[:last - factor1] = x_set[factor1:last]
+
+		# y values
+		factor1 = shape_y_train[0]
+		last = axis0_size_y - 1
+		self.y_train[:min(factor1, last)] = y_set[:min(factor1, last)]
+		if last > factor1:
+			self.y_test[:last - factor1] = y_set[factor1:last]
+
+		#set data sets with new shapes
+		self.pm.all_data_x = x_set
+		self.pm.all_data_y = y_set
+
+
+	def adjust_data_values(self):
+		"""Adjusts the values of the data sets for the neural network: the bpm average of the half-patterns
+		(parameter 27) is multiplied by 0.3 (the other parameters are not changed)."""
+		self.x_train[:, :, 27] *= 0.3
+		self.y_train[:, 27] *= 0.3
+		self.x_test[:, :, 27] *= 0.3
+		self.y_test[:, 27] *= 0.3
+
+
+	def get_train_size(self):
+		"""Returns the number of training inputs (streaming or in-memory data set)."""
+		if self.stream_train is not None:
+			return self.stream_train_size
+		return self.x_train.shape[0]
+
+	def load_data_set_shards(self):
+		"""
+		Loads the binary data set files of each raw_output_data file ('[file_name]-data_set_x.npy' and
+		'[file_name]-data_set_y.npy', see PerformanceManager.save_data_sets) from the path
+		'Performance/performance_data/data_set' as memory mapped arrays: only the headers are read now.
+		"""
+		self.shards_x.clear()
+		self.shards_y.clear()
+		files = sorted(f for f in os.listdir(self.data_set_folder) if f.endswith('-data_set_x.npy'))
+
+		for file_x in files:
+			file_y = file_x.replace('-data_set_x.npy', '-data_set_y.npy')
+			self.shards_x.append(np.load(f"{self.data_set_folder}/{file_x}", mmap_mode='r'))
+			self.shards_y.append(np.load(f"{self.data_set_folder}/{file_y}", mmap_mode='r'))
+
+		self.shards_offsets = np.cumsum([0] + [shard.shape[0] for shard in self.shards_y]).astype(np.int64)
+		print(f"Data set shards: {len(files)} files, {self.shards_offsets[-1]} inputs")
+
+	def set_streaming_data_set(self, factor, adjust_values=False):
+		"""
+		Sets the training, validation and test data sets as tf.data pipelines reading the shards of the data set
+		lazily (see self.load_data_set_shards), instead of the arrays of self.split_data_set. The memory used doesn't
+		depend on the size of the data set. The inputs of all shards follow each other: the first inputs (factor) are
+		used for training, the last ones of them for validation (same ratio as validation_split in
+		self.set_compile_neural_network) and the other inputs for the test.
+
+		:param factor: ratio of training inputs
+		:param adjust_values: True to adjust the values as in self.adjust_data_values
+		:return: nothing
+		"""
+		self.pm= self.gm.perf_manager
+		self.split_ratio = factor
+		self.stream_adjust_values = adjust_values
+		self.batch_size = 192
+		self.load_data_set_shards()
+
+		total = int(self.shards_offsets[-1])
+		train_end = round(total * factor)
+		validation_begin = int(train_end * (1.0 - factor)) # same split as validation_split= factor in keras
+		self.stream_train_size = train_end
+		print("Total x_train: ", validation_begin, " - validation: ", train_end - validation_begin, " - x_test: ", total - train_end)
+
+		self.stream_train = self.get_stream_data_set(0, validation_begin, True)
+		self.stream_validation = self.get_stream_data_set(validation_begin, train_end, False)
+		self.stream_test = self.get_stream_data_set(train_end, total, False)
+
+	def get_stream_data_set(self, idx_begin, idx_end, shuffle):
+		"""
+		Returns a tf.data pipeline of batches of the inputs idx_begin to idx_end of the shards: the indexes are shuffled
+		and batched, then the batches are read from the shards, reshaped and adjusted in parallel map stages, and the
+		next batches are prefetched while the model trains.
+		:param idx_begin: index of the first input
+		:param idx_end: index of the last input (excluded)
+		:param shuffle: True to shuffle the inputs at each epoch
+		:return: tf.data.Dataset of (x (batch, 28, 28), y (batch, 28)) batches
+		"""
+		data_set = tf.data.Dataset.range(idx_begin, idx_end)
+		if shuffle:
+			data_set = data_set.shuffle(min(max(idx_end - idx_begin, 1), self.stream_shuffle_buffer), reshuffle_each_iteration=True)
+		data_set = data_set.batch(self.batch_size)
+		data_set = data_set.map(self.read_stream_batch, num_parallel_calls=tf.data.AUTOTUNE)
+		data_set = data_set.map(self.split_stream_batch, num_parallel_calls=tf.data.AUTOTUNE)
+		if self.stream_adjust_values:
+			data_set = data_set.map(self.adjust_stream_batch, num_parallel_calls=tf.data.AUTOTUNE)
+		return data_set.prefetch(tf.data.AUTOTUNE)
+
+	def read_stream_batch(self, indexes):
+		"""Map stage: reads the inputs of a batch of indexes from the shards (see self.read_shards)."""
+		x, y = tf.numpy_function(self.read_shards, [indexes], [tf.float32, tf.float32])
+		x.set_shape((None, 25, 28))
+		y.set_shape((None, 28))
+		return x, y
+
+	def read_shards(self, indexes):
+		"""
+		Reads the inputs of the given indexes from the memory mapped shards (each shard is read once per batch).
+		:param indexes: np.array of input indexes
+		:return: x np.array (batch, 25, 28) ; y np.array (batch, 28)
+		"""
+		x = np.empty((len(indexes), 25, 28), dtype=np.float32)
+		y = np.empty((len(indexes), 28), dtype=np.float32)
+		shards = np.searchsorted(self.shards_offsets, indexes, side='right') - 1
+
+		for shard in np.unique(shards):
+			rows = np.nonzero(shards == shard)[0]
+			local = indexes[rows] - self.shards_offsets[shard]
+			x[rows] = np.reshape(self.shards_x[shard][local], (len(rows), 25, 28))
+			y[rows] = self.shards_y[shard][local]
+		return x, y
+
+	def split_stream_batch(self, x, y):
+		"""Map stage: adds 3 arrays with 0.0 values before the 25 arrays of x (shape (batch, 28, 28)),
+		as in self.split_data_set."""
+		return tf.pad(x, [[0, 0], [3, 0], [0, 0]]), y
+
+	def adjust_stream_batch(self, x, y):
+		"""Map stage: adjusts the values of a batch as in self.adjust_data_values."""
+		factors = tf.constant([1.0] * 27 + [0.3])
+		return x * factors, y * factors
+
+	def benchmark_data_pipelines(self, factor=4/5, batches=100):
+		"""
+		Compares the throughput (inputs/sec) of the in-memory data set (self.split_data_set from
+		PerformanceManager.all_data_x and all_data_y) and of the streaming data set (self.set_streaming_data_set):
+		preparation of the data sets, reading of the training batches and, if a model is compiled, training of
+		a copy of the model on the same number of batches (self.model is not trained). The data set must be loaded
+		first (PerformanceManager.load_input_data_set).
+		PerformanceManager.all_data_x and all_data_y are restored and the streaming data set is removed at the end.
+		:param factor: ratio of training inputs
+		:param batches: number of training batches read (and trained)
+		:return: nothing
+		"""
+		model = self.get_benchmark_model()
+		results = []
+		self.pm= self.gm.perf_manager
+		all_data_x, all_data_y = self.pm.all_data_x, self.pm.all_data_y
+
+		# in-memory
+		t0 = time()
+		self.split_data_set(factor)
+		prepare_time = time() - t0
+		self.pm.all_data_x, self.pm.all_data_y = all_data_x, all_data_y
+		results.append(("in-memory: split_data_set", self.x_train.shape[0] + self.x_test.shape[0], prepare_time))
+
+		self.batch_size = 192
+		number = min(batches * self.batch_size, self.x_train.shape[0])
+		t0 = time()
+		for i in range(0, number, self.batch_size):
+			x_batch = tf.constant(self.x_train[i:i + self.batch_size], dtype=tf.float32)
+			y_batch = tf.constant(self.y_train[i:i + self.batch_size], dtype=tf.float32)
+		results.append(("in-memory: batches", number, time() - t0))
+
+		if model is not None:
+			t0 = time()
+			model.fit(self.x_train[:number], self.y_train[:number], batch_size=self.batch_size, epochs=1, verbose=0)
+			results.append(("in-memory: training", number, time() - t0))
+
+		# streaming
+		t0 = time()
+		self.set_streaming_data_set(factor, self.stream_adjust_values)
+		results.append(("streaming: set_streaming_data_set", int(self.shards_offsets[-1]), time() - t0))
+
+		t0 = time()
+		number = 0
+		for x_batch, y_batch in self.stream_train.take(batches):
+			number += x_batch.shape[0]
+		results.append(("streaming: batches", number, time() - t0))
+
+		if model is not None:
+			t0 = time()
+			model.fit(self.stream_train.take(batches), epochs=1, verbose=0)
+			results.append(("streaming: training", number, time() - t0))
+
+		# train_model and evaluate_model use the in-memory data set again
+		self.stream_train = None
+		self.stream_validation = None
+		self.stream_test = None
+
+		print("")
+		for name, number, seconds in results:
+			print(f"{name:<36} {number:9d} inputs {seconds:9.3f} s {number / max(seconds, 1e-9):12.0f} inputs/sec")
+		print("")
+
+	def get_benchmark_model(self):
+		"""
+		Returns a copy of self.model compiled with the same loss, optimizer and metrics, with new weights, so the
+		benchmark doesn't change the weights of self.model.
+		:return: the copy of the model (None if no model is compiled)
+		"""
+		if self.model is None or getattr(self.model, 'optimizer', None) is None:
+			return None
+
+		model = tf.keras.models.clone_model(self.model)
+		optimizer = self.model.optimizer.__class__.from_config(self.model.optimizer.get_config())
+		model.compile(loss= 'mse', optimizer=optimizer, metrics=['accuracy'])
+		return model
+
+	def set_compile_neural_network(self):
+		"""Sets and compiles the bilateral LSTM neural network and its hyper-parameters """
+		# set model compile parameters
+
+		# hidden layers formula to start with:
+		# source:https://towardsdatascience.com/choosing-the-right-hyperparameters-for-a-simple-lstm-using-keras-f8e9ed76f046
+
+		# Nh= Nₛ / (a * (Nᵢ + Nₒ)
+		# Nᵢ is the number of input neurons, Nₒ the number of output neurons,
+		# Nₛ the number of samples in the training data, and α represents a
+		# scaling factor that is usually between 2 and 10.
+
+		train_size = self.get_train_size()
+		self.hidden_layers = int(round(train_size / (4 * (28 + 28))))  # day 6: factor= 6
+
+		self.validation_split = self.split_ratio
+		self.batch_size = 192
+
+		self.epochs = (round(train_size / self.batch_size) - 1)
+
+		self.learning_rate = 0.012 #initial rate 0.001
+		self.decay = self.learning_rate / self.epochs  # source of formula: https://towardsdatascience.com/learning-rate-schedule-in-practice-an-example-with-keras-and-tensorflow-2-0-2f48b2888a0c#:~:text=The%20constant%20learning%20rate%20is,pass%20the%20argument%20learning_rate%3D0.01%20.
+
+		#source: Sentdex - https://www.youtube.com/watch?v=BSpXCRTOLJA - shape
+
+		self.model = Sequential()
+		self.model.add(Bidirectional(LSTM(self.hidden_layers, input_shape=(28, 28), return_sequences=False)))
+		# self.model.add(GaussianNoise(0.15))  # to add robustness to the model.
+		self.model.add(Dropout(0.4)) # to add randomness and diminish overfitting.
+		self.model.add(Dense(28, activation='relu'))
+
+		opt = tf.keras.optimizers.Adam(lr=self.learning_rate, decay=self.decay) #day 6 learning rate: 0.001  - decay: decay=1e-6
+		self.model.compile(loss= 'mse', optimizer=opt, metrics=['accuracy'])
+
+
+	def save_model(self):
+		"""Saves the model to the path 'Neural_Network_Models/model'. """
+		# Save the model
+		filepath = 'Neural_Network_Models/model'
+		save_model(self.model, filepath)
+
+	def load_model(self):
+		"""Loads the model from the path 'Neural_Network_Models/model'. """
+		# Load the model
+		filepath = 'Neural_Network_Models/model'
+		self.model = load_model(filepath, compile=True)
+
+	def compare_pred_true(self):
+		"""Compares predictions of the neural network with the ground truth (y data sets:
+		self.y_train and self.y_test). Displays the results as np.array images. """
+
+		shape_x = (384, 28 * 4, 1)
+		array_y = np.zeros(shape_x)
+
+		#training
+		predictions = self.model.predict(self.x_train[-385:-1])
+		pred_idx=0
+		for c in range(4):
+			idx = c * 28
+			for r in range(0, 384, 4):
+				#convert arrays into images
+					for i in range(28):
+						array_y[r][i + idx]=predictions[pred_idx][i] # prediction
+						array_y[r + 1][i + idx]=self.y_train[pred_idx][i] # ground truth
+						array_y[r + 2][i + idx] = self.x_train[pred_idx][-1][i]  # x_test last array
+						# to make a space between the groups of 3 arrays (for visual representation purpose)
+						array_y[r + 3][i + idx] = 0.0
+					pred_idx += 1
+		plt.imshow(array_y)
+		plt.show()
+
+
+		#test
+		predictions = self.model.predict(self.x_test[-385:-1])
+		pred_idx = 0
+		for c in range(4):
+			idx = c * 28
+			for r in range(0, 384, 4):
+				# convert arrays into images
+				for i in range(28):
+					array_y[r][i + idx] = predictions[pred_idx][i]  # prediction
+					array_y[r + 1][i + idx] = self.y_test[pred_idx][i]  # ground truth
+					array_y[r + 2][i + idx] = self.x_test[pred_idx][-1][i]  # x_test last array
+					# to make a space between the groups of 3 arrays (for visual representation purpose)
+					array_y[r + 3][i + idx] = 0.0
+				pred_idx += 1
+		plt.imshow(array_y)
+		plt.show()
+
+	def optimize_patterns(self, parameter, patterns_x, patterns_y, idx_begin, number, iterations):
+		"""
+		Optimizes rhythmic patterns using the neural network to predict half-pattern average performance of randomly
+		generated rhythmic patterns. This process is repeted the specified number of times (iterations).
+
+		:param parameter: parameter to optimize - (in the final version, only parameter 11 is used, the
+		 				  average performance of half-patterns.
+		:param patterns_x: list of x data set indexes with rhythmic patterns that have the best average performance
+						   values (parameter 11)
+		:param patterns_y: list of y data set indexes associated with the patterns_x.
+		:param idx_begin: first index to optimize in the patterns_x and patterns_y lists
+		:param number: the number of indexes to optimize
+		:param iterations: number of iterations of the optimization process.
+		:return:
+		"""
+
+		best_pattern_x = []
+		best_pattern_y = []
+
+		opt_x_patterns=np.zeros((number * 6, 28, 1))
+		#iterations
+		iteration=0
+
+		#mofify rhythmic patterns_x
+		#---------------------------------------------------------------------------------------------------------------
+		shape = (1, 28, 28)
+		shape2= (28,)
+		idx=0
+		for i in range(0, number * 6, 6):
+
+			#consider only indexes idx_begin to idx_end of the patterns
+			if idx < idx_begin:
+				idx +=1
+				continue
+
+			# x_train
+			x_input=np.zeros(shape)
+			x_input[0]=patterns_x[idx].copy()
+
+			new_x_input = x_input.copy()
+
+			best_pattern_x= x_input[0][-1].copy() # set initial x_input as the best pattern, until a better one is found
+
+			# y_train
+			self.truth = np.zeros(shape2)
+			best_pattern_y= self.truth.copy()
+
+			print("")
+			print("Optimizing rhythmic pattern...")
+			print("")
+
+			for j in range(iterations):
+				# new pattern_x----------------------------------------------------------
+				# random rhythmic pattern
+				rhythmic_pattern = self.gm.rhythm_manager.generate_random_half_pattern()
+				#print(f"new rhythmic_pattern {i}-{j}= ", rhythmic_pattern)
+
+				# x_input index 12= rhythmic_value - index 13 to 25= rhythmic values
+				new_x_input[0][-1][12] = rhythmic_pattern[0]
+				for k in range(12):
+					new_x_input[0][-1][k + 12]=rhythmic_pattern[k]
+				#------------------------------------------------------------------------
+
+				#predictions - x_train
+				predict_x= self.model.predict(np.array([patterns_x[idx]]))
+				predict_x= np.reshape(predict_x, (predict_x.shape[1]))
+
+				# predictions - new pattern (with random values)
+				predict_new = self.model.predict(np.array(new_x_input))
+				predict_new = np.reshape(predict_new, (predict_new.shape[1]))
+
+				# verify if the parameters's predicted value is better then the the current one
+				if predict_new[parameter] > predict_x[parameter] and \
+						predict_new[parameter] > best_pattern_y[parameter]:                #changed: elif, not if!
+
+					best_pattern_x = new_x_input[0][-1].copy()
+					best_pattern_y = predict_new.copy()
+					#print("rhythmic_pattern= ", rhythmic_pattern)
+					print(f"best x -> Iteration {j}= ", best_pattern_x)
+			print(f"---------------------------------------------------------------------------------self.best_pattern_x {i} - end= ", best_pattern_x)
+
+			for k in range(28):
+				opt_x_patterns[i + 0][k] = best_pattern_y[k]
+				opt_x_patterns[i + 1][k] = best_pattern_x[k]
+
+				opt_x_patterns[i + 2][k] = predict_x[k]
+				opt_x_patterns[i + 3][k] = patterns_y[idx][k]
+				opt_x_patterns[i + 4][k] = patterns_x[idx][-1][k]
+
+				opt_x_patterns[i + 5][k] = 0.0
+
+			print(idx, ": ", patterns_y[idx][parameter], "-", predict_x[parameter], "-", best_pattern_y[parameter])
+			print("*******************************************")
+
+			idx += 1
+			iteration +=1
+
+			if iteration == number:
+				break
+
+		plt.imshow(opt_x_patterns)
+		plt.show()
+
+
+	def optimize_patterns_batched(self, parameter, patterns_x, patterns_y, idx_begin, number, iterations, time_budget=0.0):
+		"""
+		Batched version of the method self.optimize_patterns: candidate half-patterns are generated and predicted by
+		groups of self.opt_batch_size in a single call of the model, and the prediction of the original pattern is
+		calculated only once. After the first (random) group, the self.opt_survivors best candidates are mutated to
+		generate the next group (evolutionary search), with a part of new random candidates
+		(self.opt_random_ratio). The survivors are selected from the new candidates, the previous survivors and the
+		best pattern found so far (elitism), so the search never loses its best candidates. The search stops after
+		the number of evaluated candidates given by iterations or after time_budget seconds.
+
+		:param parameter: parameter to optimize - (in the final version, only parameter 11 is used, the
+						  average performance of half-patterns.
+		:param patterns_x: list of x data set indexes with rhythmic patterns that have the best average performance
+						   values (parameter 11)
+		:param patterns_y: list of y data set indexes associated with the patterns_x.
+		:param idx_begin: first index to optimize in the patterns_x and patterns_y lists
+		:param number: the number of indexes to optimize
+		:param iterations: number of candidates to evaluate for each pattern (evaluation budget).
+		:param time_budget: maximum time in seconds to optimize each pattern (0.0= no time budget)
+		:return:
+		"""
+		rm = self.gm.rhythm_manager
+		opt_x_patterns = np.zeros((number * 6, 28, 1))
+		total_candidates = 0
+		total_time = 0.0
+
+		for idx in range(idx_begin, number):
+			i = idx * 6
+
+			print("")
+			print("Optimizing rhythmic pattern...")
+			print("")
+
+			x_input = np.asarray(patterns_x[idx], dtype=np.float32)
+
+			# prediction of the original pattern - calculated once
+			predict_x = self.model(x_input[np.newaxis], training=False).numpy()[0]
+
+			best_pattern_x = x_input[-1].copy() # set initial x_input as the best pattern, until a better one is found
+			best_pattern_y = np.zeros((28,))
+
+			# selection pool: the original half-pattern (x_input index 12 to 23) and its prediction
+			survivors = best_pattern_x[np.newaxis, 12:24].copy()
+			survivors_y = predict_x[np.newaxis, parameter].copy()
+			evaluated = 0
+			start = time()
+			while evaluated < iterations:
+				if time_budget > 0.0 and time() - start >= time_budget:
+					break
+				batch_size = min(self.opt_batch_size, iterations - evaluated)
+
+				# new candidate half-patterns------------------------------------------
+				if evaluated == 0 or self.opt_survivors == 0:
+					candidates = rm.generate_random_half_patterns(batch_size)
+				else:
+					random_number = int(round(batch_size * self.opt_random_ratio))
+					children = survivors[np.random.randint(0, survivors.shape[0], batch_size - random_number)]
+					mutations = np.random.random_sample(children.shape) < self.opt_mutation_rate
+					children[mutations] = rm.generate_random_half_patterns(batch_size - random_number)[mutations]
+					candidates = np.concatenate((children, rm.generate_random_half_patterns(random_number)))
+
+				# x_input index 12 to 23= rhythmic values
+				new_x_inputs = np.repeat(x_input[np.newaxis], candidates.shape[0], axis=0)
+				new_x_inputs[:, -1, 12:24] = candidates
+				#------------------------------------------------------------------------
+
+				# predictions - all candidates at once
+				predict_new = self.model(new_x_inputs, training=False).numpy()
+				evaluated += candidates.shape[0]
+
+				# verify if the best parameter's predicted value is better then the the current one
+				best = np.argmax(predict_new[:, parameter])
+				if predict_new[best][parameter] > predict_x[parameter] and \
+						predict_new[best][parameter] > best_pattern_y[parameter]:
+					best_pattern_x = new_x_inputs[best][-1].copy()
+					best_pattern_y = predict_new[best].copy()
+					print(f"best x -> Evaluation {evaluated}= ", best_pattern_x)
+
+				# best candidates for the next generation, among the new candidates and the previous survivors
+				# (the best pattern found so far is always the first survivor)
+				if self.opt_survivors > 0:
+					pool = np.concatenate((survivors, candidates))
+					pool_y = np.concatenate((survivors_y, predict_new[:, parameter]))
+					order = np.argsort(-pool_y, kind='stable')[:self.opt_survivors]
+					survivors = pool[order]
+					survivors_y = pool_y[order]
+
+			elapsed = time() - start
+			total_candidates += evaluated
+			total_time += elapsed
+			print(f"---------------------------------------------------------------------------------self.best_pattern_x {i} - end= ", best_pattern_x)
+			print(f"{evaluated} candidates in {elapsed:.2f} s ({evaluated / max(elapsed, 1e-9):.1f} candidates/sec)")
+
+			opt_x_patterns[i + 0, :, 0] = best_pattern_y
+			opt_x_patterns[i + 1, :, 0] = best_pattern_x
+			opt_x_patterns[i + 2, :, 0] = predict_x
+			opt_x_patterns[i + 3, :, 0] = patterns_y[idx]
+			opt_x_patterns[i + 4, :, 0] = patterns_x[idx][-1]
+			# to make a space between the groups of arrays (row i + 5 stays 0.0)
+
+			print(idx, ": ", patterns_y[idx][parameter], "-", predict_x[parameter], "-", best_pattern_y[parameter])
+			print("*******************************************")
+
+		print(f"Total: {total_candidates} candidates in {total_time:.2f} s "
+			  f"({total_candidates / max(total_time, 1e-9):.1f} candidates/sec)")
+
+		plt.imshow(opt_x_patterns)
+		plt.show()
+
+	def train_model(self):
+		"""Trains the neural network with the current data set (self.x_train and self.y_train)."""
+		#tensorboard - not used in this version (needs to be adapted in future versions)
+
+		self.tensorboard= TensorBoard(log_dir="Logs/{}".format(time()))
+		training_log_dir = os.path.join(self.tensorboard.log_dir, 'training')
+		writer= tf.summary.create_file_writer(training_log_dir)
+
+		# Train the model
+		if self.stream_train is not None:
+			# streaming data set (the validation inputs are the last ones of the training inputs, like validation_split)
+			self.hist = self.model.fit(self.stream_train,
+									   epochs= self.epochs,
+									   validation_data=self.stream_validation,
+									   callbacks=[self.tensorboard])
+		else:
+			self.hist = self.model.fit(self.x_train, self.y_train,
+									   batch_size=self.batch_size,
+									   epochs= self.epochs,
+									   validation_split=self.validation_split,
+									   callbacks=[self.tensorboard])
+
+
+	def evaluate_model(self):
+		"""Evaluates the neural network with the test data set (self.x_test and self.y_test).
+		Shows training history for the parameters 'accuracy'[training set], 'val_accuracy'[test set],
+		'loss'[training set] and 'val_loss'[test set] """
+
+		# Evaluate the model using test data set
+		if self.stream_test is not None:
+			self.model.evaluate(self.stream_test)
+		else:
+			self.model.evaluate(self.x_test, self.y_test)[1]
+
+		plt.style.use('fivethirtyeight')
+		#source: https: // www.pluralsight.com / guides / data - visualization - deep - learning - model - using - matplotlib
+		plt.plot(self.hist.history['accuracy'], 'g', label='Training accuracy')
+		plt.plot(self.hist.history['val_accuracy'], 'b', label='Validation accuracy')
+		plt.show()
+		plt.plot(self.hist.history['loss'], 'g', label='Training loss')
+		plt.plot(self.hist.history['val_loss'], 'b', label='Validation loss')
+		plt.show()
+
+
+"""
+source: https://www.youtube.com/watch?v=2U6Jl7oqRkM
+NOTE: To connect to the tensorboard page where graphics are shown, copy-paste the following in the terminal: 
+	  tensorboard --logdir=log_dir
+"""
@@ -0,0 +1,245 @@
+"""
+Project: Adaptive Rhythmic Training Application (ARTA)
+File   : notescheduler.py
+Author : Yann Savard
+
+This code is open source, except for some parts that were taken
+from external sources and their sources are mentioned in the code.
+"""
+
+import sys
+import threading
+import time
+
+#numpy
+import numpy as np
+
+
+class NoteScheduler():
+    def __init__(self, time_division=8, round_notes=600, sound_latency=0.2):
+        """
+        Timer of the game state play with absolute times: the time of each tick (time_division ticks per note) is
+        computed in advance for a whole round from the tempo, so the ticks don't drift when the main loop is late.
+        The ticks are dispatched to the main loop (GameManager.manage_timer) and the metronome sound is played by a
+        dedicated thread at the time of each note, minus the latency of the midi output.
+
+        Threads and locks are created in self.start(), so the object can be given to the pygame process.
+
+        :param time_division: number of ticks per note
+        :param round_notes: number of notes computed in advance
+        :param sound_latency: time in seconds between the midi message and the sound (the sound is sent earlier by
+                              this time; the previous hand-tuned compensation sent it 0.17 to 0.3 s before the notes).
+                              The default value is an estimate: it must be measured on the training computer.
+        """
+        self.time_division = time_division
+        self.round_ticks = round_notes * time_division
+        self.sound_latency = sound_latency
+
+        # timeline
+        self.tick_period = 0.0 # time between two ticks in seconds
+        self.anchor = (0, 0.0) # (tick, time) from which the following ticks are computed with self.tick_period
+        self.first_tick = 0 # tick of self.timeline[0]
+        self.timeline = np.zeros(0) # times (time.perf_counter) of the ticks self.first_tick to self.first_tick + self.round_ticks
+        self.next_tick = 0 # next tick to dispatch to the main loop
+        self.max_late_ticks = time_division # when the main loop is later than this, the timeline restarts from now
+
+        # metronome thread
+        self.play_sound = None # function playing the metronome sound (RhythmManager.play_sound)
+        self.sound_jitters = [] # delays of the metronome sounds (see self.add_sound_jitters)
+        self.next_sound_tick = 0 # tick of the next metronome sound
+        self.running = False
+        self.lock = None
+        self.thread = None
+
+    def start(self, start_time, tick_period, first_tick, play_sound):
+        """
+        Computes the timeline from the first tick and starts the metronome thread.
+        :param start_time: time of the first tick (time.perf_counter)
+        :param tick_period: time between two ticks in seconds
+        :param first_tick: number of the first tick (GameManager.ticks)
+        :param play_sound: function playing the metronome sound
+        :return: nothing
+        """
+        self.play_sound = play_sound
+        self.lock = threading.Lock()
+
+        self.tick_period = tick_period
+        self.anchor = (first_tick, start_time)
+        self.next_tick = first_tick
+        self.next_sound_tick = self.get_next_note_tick(first_tick)
+        self.compute_timeline(first_tick)
+
+        # switch more often between the threads (default: 5 ms), so the metronome thread runs when it wakes up
+        sys.setswitchinterval(0.0005)
+
+        self.running = True
+        self.thread = threading.Thread(target=self.run_sounds, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stops the metronome thread."""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # TIMELINE
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def compute_timeline(self, first_tick):
+        """
+        Computes the times of the ticks of a round from self.anchor and self.tick_period (lock must be acquired).
+        :param first_tick: first tick of the timeline
+        :return: nothing
+        """
+        anchor_tick, anchor_time = self.anchor
+        self.first_tick = first_tick
+        self.timeline = anchor_time + (np.arange(first_tick, first_tick + self.round_ticks) - anchor_tick) * self.tick_period
+
+    def get_tick_time(self, tick):
+        """Returns the time of a tick (lock must be acquired)."""
+        idx = tick - self.first_tick
+        if 0 <= idx < len(self.timeline):
+            return self.timeline[idx]
+        anchor_tick, anchor_time = self.anchor
+        return anchor_time + (tick - anchor_tick) * self.tick_period
+
+    def get_next_note_tick(self, tick):
+        """Returns the first tick of a note from the given tick."""
+        return -(-tick // self.time_division) * self.time_division
+
+    def get_next_tick_time(self):
+        """Returns the time of the next tick to dispatch."""
+        with self.lock:
+            return self.get_tick_time(self.next_tick)
+
+    def set_tick_period(self, tick_period):
+        """
+        Reschedules the ticks after the last tick dispatched with a new tick period (tempo change). Only the remaining
+        ticks of the timeline are computed again.
+        :param tick_period: time between two ticks in seconds
+        :return: nothing
+        """
+        if tick_period == self.tick_period or self.lock is None:
+            self.tick_period = tick_period
+            return
+
+        with self.lock:
+            last_tick = self.next_tick - 1
+            self.anchor = (last_tick, self.get_tick_time(last_tick))
+            self.tick_period = tick_period
+
+            first_tick = max(last_tick, self.first_tick)
+            self.timeline[first_tick - self.first_tick:] = self.anchor[1] + \
+                (np.arange(first_tick, self.first_tick + len(self.timeline)) - last_tick) * tick_period
+
+    def get_due_ticks(self, now):
+        """
+        Returns the number of ticks whose time has passed and that were not dispatched yet. If the main loop was
+        blocked (more than self.max_late_ticks), the timeline restarts from now and only 1 tick is due.
+        :param now: present time (time.perf_counter)
+        :return: number of ticks to dispatch
+        """
+        with self.lock:
+            idx = self.next_tick - self.first_tick
+            if idx >= len(self.timeline):
+                self.compute_timeline(self.next_tick)
+                idx = 0
+            due_ticks = int(np.searchsorted(self.timeline, now, side='right')) - idx
+
+            if due_ticks == len(self.timeline) - idx: # the whole timeline passed
+                due_ticks = int((now - self.get_tick_time(self.next_tick)) / self.tick_period) + 1
+
+            if due_ticks > self.max_late_ticks:
+                self.restart(now)
+                due_ticks = 1
+
+        return max(due_ticks, 0)
+
+    def dispatch_tick(self):
+        """
+        Dispatches the next tick to the main loop.
+        :return: time at which the tick was scheduled
+        """
+        with self.lock:
+            tick_time = self.get_tick_time(self.next_tick)
+            self.next_tick += 1
+        return tick_time
+
+    def restart(self, now):
+        """
+        Restarts the timeline from the next tick at the present time (lock must be acquired). The metronome restarts
+        at the next note.
+        :param now: present time (time.perf_counter)
+        :return: nothing
+        """
+        self.anchor = (self.next_tick, now)
+        self.compute_timeline(self.next_tick)
+
+        self.next_sound_tick = self.get_next_note_tick(self.next_tick)
+        if self.get_tick_time(self.next_sound_tick) - self.sound_latency < now:
+            self.next_sound_tick += self.time_division
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # METRONOME THREAD
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def set_thread_priority(self):
+        """Sets the highest priority to the present thread (only on Windows)."""
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 15) # THREAD_PRIORITY_TIME_CRITICAL
+        except (AttributeError, OSError):
+            pass
+
+    def run_sounds(self):
+        """
+        Plays the metronome sound of each note at its time in the timeline minus self.sound_latency. The thread
+        sleeps until 2 ms before the sound and waits the last milliseconds actively. The sounds are paused when the
+        main loop is blocked (e.g. validation window at the end of a round).
+        :return: nothing
+        """
+        self.set_thread_priority()
+
+        while self.running:
+            with self.lock:
+                tick = self.next_sound_tick
+                sound_time = self.get_tick_time(tick) - self.sound_latency
+                main_loop_time = self.get_tick_time(self.next_tick)
+
+            now = time.perf_counter()
+            if now - main_loop_time > self.max_late_ticks * self.tick_period:
+                time.sleep(0.005)
+                continue
+
+            # sleep by short steps, the time of the sound can change with the tempo
+            if sound_time - now > 0.002:
+                time.sleep(min(sound_time - now - 0.002, 0.005))
+                continue
+
+            while time.perf_counter() < sound_time:
+                time.sleep(0)
+
+            played = time.perf_counter()
+            self.play_sound(0)
+
+            with self.lock:
+                self.sound_jitters.append(played - sound_time)
+                if self.next_sound_tick == tick:
+                    self.next_sound_tick = tick + self.time_division
+
+    def add_sound_jitters(self, stats):
+        """
+        Adds the delays of the metronome sounds played since the last call to the 'sound_jitter' histogram (called by
+        the main thread, FrameStats is not shared with the metronome thread).
+        :param stats: FrameStats
+        :return: nothing
+        """
+        if self.lock is None:
+            return
+        with self.lock:
+            sound_jitters, self.sound_jitters = self.sound_jitters, []
+        for sound_jitter in sound_jitters:
+            stats.add('sound_jitter', sound_jitter)
@@ -0,0 +1,99 @@
+"""
+Project: Adaptive Rhythmic Training Application (ARTA)
+File   : sessionstore.py
+Author : Yann Savard
+
+This code is open source, except for some parts that were taken
+from external sources and their sources are mentioned in the code.
+"""
+
+#numpy
+import numpy as np
+
+
+class SessionStore():
+    def __init__(self, params=28, capacity=2048):
+        """
+        Preallocated storage of the rows of the neural matrix of a training session (PerformanceManager.neural_matrix),
+        which is a view of the used rows [self.start:self.start + self.length] of self.matrix. Rows are added and
+        deleted without copying the matrix.
+
+        :param params: number of parameters for each runit (columns of the neural matrix)
+        :param capacity: number of rows allocated (the matrix is enlarged if needed)
+        """
+        self.params = params
+
+        # neural matrix
+        self.matrix = np.zeros((capacity, params))
+        self.start = 0 # index of the first row of the neural matrix in self.matrix
+        self.length = 0 # number of rows of the neural matrix
+
+    def get_matrix(self):
+        """
+        Returns the neural matrix as a view of self.matrix (rows can be modified in place).
+        """
+        return self.matrix[self.start:self.start + self.length]
+
+    def reset_matrix(self, rows):
+        """
+        Resets the neural matrix to the given number of rows with the value 0.0.
+        :param rows: number of rows
+        :return: the neural matrix
+        """
+        self.start = 0
+        self.length = 0
+        self.reserve_rows(rows)
+        self.matrix[:rows] = 0.0
+        self.length = rows
+        return self.get_matrix()
+
+    def reserve_rows(self, rows):
+        """
+        Makes sure that rows can be added after the last row of the neural matrix: the used rows are moved to the
+        beginning of self.matrix when its end is reached, and self.matrix is enlarged if it is too small.
+        :param rows: number of rows to add
+        :return: nothing
+        """
+        if self.start + self.length + rows <= self.matrix.shape[0]:
+            return
+
+        if self.length + rows > self.matrix.shape[0]:
+            new_matrix = np.zeros((max(self.matrix.shape[0] * 2, self.length + rows), self.params))
+            new_matrix[:self.length] = self.get_matrix()
+            self.matrix = new_matrix
+        else:
+            self.matrix[:self.length] = self.get_matrix()
+        self.start = 0
+
+    def insert_row_before_last(self):
+        """
+        Inserts a row with the value 0.0 before the last row of the neural matrix
+        (same result as np.insert(neural_matrix, -1, 0.0, axis=0)).
+        :return: the neural matrix
+        """
+        self.reserve_rows(1)
+        end = self.start + self.length
+        self.matrix[end] = self.matrix[end - 1]
+        self.matrix[end - 1] = 0.0
+        self.length += 1
+        return self.get_matrix()
+
+    def delete_first_rows(self, rows):
+        """
+        Deletes the first rows of the neural matrix.
+        :param rows: number of rows to delete
+        :return: the neural matrix
+        """
+        rows = min(rows, self.length)
+        self.start += rows
+        self.length -= rows
+        return self.get_matrix()
+
+    def delete_last_rows(self, rows):
+        """
+        Deletes the last rows of the neural matrix.
+        :param rows: number of rows to delete
+        :return: the neural matrix
+        """
+        self.length -= min(rows, self.length)
+        return self.get_matrix()